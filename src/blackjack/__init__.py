@@ -21,7 +21,14 @@ Notes:
 ===================================================================
 """
 
-from .game import Card, Deck, Hand, GameState
+from .game import Card, Deck, Hand, GameState, dealer_outcome_probabilities, simulate_rounds
 
-__all__ = ["Card", "Deck", "Hand", "GameState"]
+__all__ = [
+    "Card",
+    "Deck",
+    "Hand",
+    "GameState",
+    "dealer_outcome_probabilities",
+    "simulate_rounds",
+]
 __version__ = "0.1.0"
\ No newline at end of file
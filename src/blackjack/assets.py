@@ -13,6 +13,7 @@ License: MIT License (see LICENSE file for details)
 Description:
 Card image loader with lazy generation using Pillow.
 - Generates minimal PNGs (100x145) like "A_spades.png" on first use.
+- Also generates the card back, "_back.png".
 - Falls back to text-rendered Tk card if Pillow unavailable.
 
 Usage:
@@ -25,8 +26,9 @@ Notes:
 
 from __future__ import annotations
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Tuple
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -40,6 +42,7 @@ from .game import Card, RANKS, SUITS
 from .utils import suit_symbol
 
 
+@lru_cache(maxsize=1)
 def _cache_dir() -> Path:
     base = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
     d = base / "blackjack_cards"
@@ -52,18 +55,64 @@ class CardImageProvider:
         self.card_w = card_w
         self.card_h = card_h
         self._cache: Dict[str, PhotoImage] = {}
+        self._back: PhotoImage | None = None
+        # True once every card and the back were loaded from generated PNGs
+        self.has_real_images = False
         if PIL_OK:
+            self._font_big, self._font_small = self._load_fonts()
+            self._sym_by_suit = {s: suit_symbol(s) for s in SUITS}
+            # Text widths repeat across cards: measure each string once
+            probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+            self._sym_w = {
+                s: probe.textlength(self._sym_by_suit[s], font=self._font_big) for s in SUITS
+            }
+            self._rank_w = {r: probe.textlength(r, font=self._font_small) for r in RANKS}
             self._ensure_generated()
+        self._preload()
+
+    @staticmethod
+    def _load_fonts() -> Tuple[Any, Any]:
+        try:
+            return (
+                ImageFont.truetype("DejaVuSans-Bold.ttf", 34),
+                ImageFont.truetype("DejaVuSans.ttf", 20),
+            )
+        except Exception:
+            return ImageFont.load_default(), ImageFont.load_default()
 
     def _ensure_generated(self) -> None:
         cd = _cache_dir()
+        # One directory listing instead of a stat per card
+        existing = set(os.listdir(cd))
         # Generate all cards if any missing
         for s in SUITS:
             for r in RANKS:
                 name = f"{r}_{s}.png"
-                path = cd / name
-                if not path.exists():
-                    self._generate_card_png(path, r, s)
+                if name not in existing:
+                    self._generate_card_png(cd / name, r, s)
+        if "_back.png" not in existing:
+            self._generate_back_png(cd / "_back.png")
+
+    def _preload(self) -> None:
+        # Load every card up front so get() never touches the filesystem
+        cd = _cache_dir()
+        existing = set(os.listdir(cd))
+        real = True
+        for s in SUITS:
+            for r in RANKS:
+                key = f"{r}_{s}"
+                if f"{key}.png" in existing:
+                    self._cache[key] = PhotoImage(file=str(cd / f"{key}.png"))
+                else:
+                    # text fallback
+                    self._cache[key] = self._text_card(Card(r, s))
+                    real = False
+        if "_back.png" in existing:
+            self._back = PhotoImage(file=str(cd / "_back.png"))
+        else:
+            self._back = PhotoImage(width=self.card_w, height=self.card_h)
+            real = False
+        self.has_real_images = real
 
     def _generate_card_png(self, path: Path, rank: str, suit: str) -> None:
         if not PIL_OK:
@@ -73,34 +122,44 @@ class CardImageProvider:
         # Border
         draw.rounded_rectangle([1, 1, self.card_w - 2, self.card_h - 2], radius=12, outline=(0, 0, 0), width=2)
         # Texts
-        try:
-            font_big = ImageFont.truetype("DejaVuSans-Bold.ttf", 34)
-            font_small = ImageFont.truetype("DejaVuSans.ttf", 20)
-        except Exception:
-            font_big = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-
-        sym = suit_symbol(suit)
+        font_big, font_small = self._font_big, self._font_small
+        sym = self._sym_by_suit[suit]
         # Center symbol
-        w, h = draw.textlength(sym, font=font_big), 34
+        w, h = self._sym_w[suit], 34
         draw.text(((self.card_w - w) / 2, (self.card_h - h) / 2), sym, fill=(0, 0, 0), font=font_big)
         # Corner rank
         draw.text((8, 6), rank, fill=(0, 0, 0), font=font_small)
-        draw.text((self.card_w - 8 - draw.textlength(rank, font=font_small), self.card_h - 6 - 20), rank, fill=(0, 0, 0), font=font_small)
+        draw.text(
+            (self.card_w - 8 - self._rank_w[rank], self.card_h - 6 - 20),
+            rank,
+            fill=(0, 0, 0),
+            font=font_small,
+        )
+        img.save(path)
+
+    def _generate_back_png(self, path: Path) -> None:
+        if not PIL_OK:
+            return
+        # Transparent so the table colour shows through, like the drawn fallback
+        img = Image.new("RGBA", (self.card_w, self.card_h), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        white = (255, 255, 255)
+        draw.rounded_rectangle(
+            [1, 1, self.card_w - 2, self.card_h - 2], radius=12, outline=white, width=2
+        )
+        draw.rectangle([6, 6, self.card_w - 7, self.card_h - 7], outline=white)
+        star = "\u2605"
+        w, h = draw.textlength(star, font=self._font_big), 34
+        draw.text(
+            ((self.card_w - w) / 2, (self.card_h - h) / 2), star, fill=white, font=self._font_big
+        )
         img.save(path)
 
     def get(self, card: Card) -> PhotoImage:
-        key = card.name
-        if key in self._cache:
-            return self._cache[key]
-        path = _cache_dir() / f"{key}.png"
-        if path.exists():
-            img = PhotoImage(file=str(path))
-        else:
-            # text fallback
-            img = self._text_card(card)
-        self._cache[key] = img
-        return img
+        return self._cache[card.name]
+
+    def back(self) -> PhotoImage:
+        return self._back
 
     def _text_card(self, card: Card) -> PhotoImage:
         # Create a minimal 1x1 and draw via Tk (text on Canvas will be used); as PhotoImage, make blank
@@ -25,70 +25,182 @@ Notes:
 """
 
 from __future__ import annotations
-import random
+import os
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from functools import lru_cache
+from typing import ClassVar, Dict, Iterable, List, Tuple
 
-from .utils import best_ace_total
+import numpy as np
 
 RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
 SUITS = ["hearts", "diamonds", "clubs", "spades"]
 
+# Card.code layout: bits 0-3 blackjack value (ace = 1), bit 4 ace flag,
+# bits 5-6 suit index, bits 7-10 rank index
+VALUE_MASK = 0x0F
+ACE_SHIFT = 4
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True, init=False)
 class Card:
+    """An immutable playing card.
+
+    Cards are interned: Card(rank, suit) always returns the same object, so
+    only 52 instances ever exist.
+    """
+
     rank: str
     suit: str
+    # Derived once at construction; cards are immutable so these never change
+    value: int = field(repr=False, compare=False)
+    name: str = field(repr=False, compare=False)
+    code: int = field(repr=False, compare=False)
+    index: int = field(repr=False, compare=False)  # position in _MASTER_DECK, 0-51
 
-    @property
-    def name(self) -> str:
-        return f"{self.rank}_{self.suit}"
+    _pool: ClassVar[Dict[Tuple[str, str], Card]] = {}
+
+    def __new__(cls, rank: str, suit: str) -> Card:
+        card = cls._pool.get((rank, suit))
+        if card is not None:
+            return card
+        if rank in {"J", "Q", "K"}:
+            value = 10
+        elif rank == "A":
+            value = 1
+        else:
+            value = int(rank)
+        suit_idx, rank_idx = SUITS.index(suit), RANKS.index(rank)
+        code = value | (rank == "A") << ACE_SHIFT | suit_idx << 5 | rank_idx << 7
+        card = object.__new__(cls)
+        object.__setattr__(card, "rank", rank)
+        object.__setattr__(card, "suit", suit)
+        object.__setattr__(card, "value", value)
+        object.__setattr__(card, "name", f"{rank}_{suit}")
+        object.__setattr__(card, "code", code)
+        object.__setattr__(card, "index", suit_idx * len(RANKS) + rank_idx)
+        cls._pool[(rank, suit)] = card
+        return card
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, str]]:
+        # Unpickling and copying go back through the pool
+        return (Card, (self.rank, self.suit))
+
+
+# Default PCG64 generator for decks and the simulator; faster than the legacy global RandomState
+_RNG = np.random.default_rng()
+
+
+def _reseed_after_fork() -> None:
+    # A forked child inherits _RNG's state; reseed in place (decks hold a reference)
+    # so parallel workers don't replay the same shuffles, as the random module does
+    _RNG.bit_generator.state = np.random.PCG64().state
 
-    @property
-    def value(self) -> int:
-        if self.rank in {"J", "Q", "K"}:
-            return 10
-        if self.rank == "A":
-            return 1
-        return int(self.rank)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
+
+# Every Deck starts as a copy of this; built once at import time (fills the Card pool)
+_MASTER_DECK: Tuple[Card, ...] = tuple(Card(r, s) for s in SUITS for r in RANKS)
+# Card codes aligned with _MASTER_DECK, for array-based scoring
+_CODES = np.array([c.code for c in _MASTER_DECK], dtype=np.uint16)
 
 
 class Deck:
-    def __init__(self) -> None:
-        self.cards: List[Card] = [Card(r, s) for s in SUITS for r in RANKS]
+    """52 cards held as a shuffled array of indices into _MASTER_DECK.
+
+    Cards are dealt by advancing a cursor, so draw() never mutates the array.
+    Pass a seeded ``rng`` for reproducible shuffles.
+    """
+
+    def __init__(self, rng: np.random.Generator | None = None) -> None:
+        self._rng = rng if rng is not None else _RNG
+        self._idx = np.arange(len(_MASTER_DECK), dtype=np.int8)
+        self._cursor = 0
+        self.shuffle()
+
+    @property
+    def cards(self) -> List[Card]:
+        """Remaining cards, in the order they will be drawn."""
+        return [_MASTER_DECK[i] for i in self._idx[self._cursor :].tolist()]
+
+    def reset(self) -> None:
+        """Restore all 52 cards and shuffle."""
+        self._cursor = 0
         self.shuffle()
 
     def shuffle(self) -> None:
-        random.shuffle(self.cards)
+        # Only the undealt part: cards already in hands must not come back
+        self._rng.shuffle(self._idx[self._cursor :])
 
     def draw(self) -> Card:
-        if not self.cards:
-            # Recreate fresh deck if exhausted
-            self.__init__()
-        return self.cards.pop()
+        if self._cursor >= len(self._idx):
+            # Start a fresh deck if exhausted
+            self.reset()
+        card = _MASTER_DECK[self._idx[self._cursor]]
+        self._cursor += 1
+        return card
 
     def remaining(self) -> int:
-        return len(self.cards)
+        return len(self._idx) - self._cursor
+
+    def composition(self) -> Tuple[int, ...]:
+        """Remaining card counts per blackjack value; index 0 is aces, 9 is tens."""
+        values = _CODES[self._idx[self._cursor :]] & VALUE_MASK
+        return tuple(np.bincount(values, minlength=11)[1:].tolist())
 
 
 class Hand:
     def __init__(self) -> None:
-        self.cards: List[Card] = []
+        # Cards held as _MASTER_DECK indices in a contiguous byte buffer
+        self._indices = array("B")
+        # Running tally (hard total with aces as 1, ace count, best value) kept in step with add()
+        self._hard = 0
+        self._aces = 0
+        self._value = 0
+
+    @classmethod
+    def from_indices(cls, indices: Iterable[int]) -> Hand:
+        """Build a hand from _MASTER_DECK indices (Card.index, not Card.code)."""
+        hand = cls()
+        for i in indices:
+            hand.add(i)
+        return hand
 
-    def add(self, card: Card) -> None:
-        self.cards.append(card)
+    @property
+    def cards(self) -> Tuple[Card, ...]:
+        # Read-only snapshot; change the hand through add() or by assigning cards
+        return tuple(_MASTER_DECK[i] for i in self._indices)
+
+    @cards.setter
+    def cards(self, cards: Iterable[Card]) -> None:
+        self._indices = array("B")
+        self._hard = 0
+        self._aces = 0
+        self._value = 0
+        for c in cards:
+            self.add(c)
+
+    def add(self, card: Card | int) -> None:
+        """Add a Card, or a card given by its _MASTER_DECK index."""
+        if not isinstance(card, Card):
+            card = _MASTER_DECK[card]
+        self._indices.append(card.index)
+        code = card.code
+        self._hard += code & VALUE_MASK
+        self._aces += code >> ACE_SHIFT & 1
+        t = self._hard
+        self._value = t + 10 if self._aces and t + 10 <= 21 else t
 
     @property
     def value(self) -> int:
-        base = sum(c.value for c in self.cards if c.rank != "A")
-        aces = sum(1 for c in self.cards if c.rank == "A")
-        return best_ace_total(base, aces)
+        return self._value
 
     def is_blackjack(self) -> bool:
-        return len(self.cards) == 2 and self.value == 21
+        return len(self._indices) == 2 and self._value == 21
 
     def is_bust(self) -> bool:
-        return self.value > 21
+        return self._value > 21
 
 
 @dataclass
@@ -100,7 +212,7 @@ class GameState:
     outcome: str | None = None  # "player", "dealer", "push"
 
     def reset(self) -> None:
-        self.deck = Deck()
+        self.deck.reset()
         self.player_hand = Hand()
         self.dealer_hand = Hand()
         self.in_round = False
@@ -111,7 +223,7 @@ class GameState:
         self.dealer_hand = Hand()
         # Ensure sufficient cards
         if self.deck.remaining() < 10:
-            self.deck = Deck()
+            self.deck.reset()
         # Initial deal
         self.player_hand.add(self.deck.draw())
         self.dealer_hand.add(self.deck.draw())
@@ -138,13 +250,113 @@ class GameState:
         self.outcome = self._compare()
 
     def _compare(self) -> str:
-        if self.player_hand.is_bust():
-            return "dealer"
-        if self.dealer_hand.is_bust():
-            return "player"
         pv, dv = self.player_hand.value, self.dealer_hand.value
-        if pv > dv:
-            return "player"
-        if dv > pv:
+        if pv > 21:
             return "dealer"
-        return "push"
\ No newline at end of file
+        if dv > 21:
+            return "player"
+        return "player" if pv > dv else "dealer" if dv > pv else "push"
+
+
+def _play_out(
+    values: np.ndarray,
+    aces: np.ndarray,
+    total: np.ndarray,
+    soft: np.ndarray,
+    cursor: np.ndarray,
+    stand_on: int,
+) -> np.ndarray:
+    """Hit every row below ``stand_on``, in place; return the final hand values."""
+    rows = np.arange(len(total))
+    while True:
+        value = np.where(soft & (total + 10 <= 21), total + 10, total)
+        hit = value < stand_on
+        if not hit.any():
+            return value
+        r, c = rows[hit], cursor[hit]
+        total[r] += values[r, c]
+        soft[r] |= aces[r, c]
+        cursor[r] += 1
+
+
+def simulate_rounds(
+    n: int, player_stand: int = 17, rng: np.random.Generator | None = None
+) -> Dict[str, int]:
+    """Deal and settle ``n`` independent rounds at once, each from a fresh deck.
+
+    Follows the GameState rules: the player hits until reaching ``player_stand``,
+    then the dealer hits until 17 or more. Returns outcome counts keyed
+    "player_win", "dealer_win" and "push". Pass a seeded ``rng`` to reproduce a run.
+    Raises ValueError if ``player_stand`` is above 21.
+    """
+    if player_stand > 21:
+        raise ValueError(f"player_stand must be at most 21, got {player_stand}")
+    rng = rng if rng is not None else _RNG
+    # One shuffled deck per row; column order is the draw order
+    perms = np.argsort(rng.random((n, len(_MASTER_DECK))), axis=1).astype(np.int8)
+    codes = _CODES[perms]
+    values = (codes & VALUE_MASK).astype(np.int16)
+    aces = (codes >> ACE_SHIFT & 1).astype(bool)
+
+    # Initial deal alternates player, dealer, player, dealer
+    player_total = values[:, 0] + values[:, 2]
+    player_soft = aces[:, 0] | aces[:, 2]
+    dealer_total = values[:, 1] + values[:, 3]
+    dealer_soft = aces[:, 1] | aces[:, 3]
+    cursor = np.full(n, 4)
+
+    pv = _play_out(values, aces, player_total, player_soft, cursor, player_stand)
+    dv = _play_out(values, aces, dealer_total, dealer_soft, cursor, 17)
+
+    player_bust, dealer_bust = pv > 21, dv > 21
+    player_win = ~player_bust & (dealer_bust | (pv > dv))
+    dealer_win = player_bust | (~dealer_bust & (dv > pv))
+    wins, losses = int(player_win.sum()), int(dealer_win.sum())
+    return {"player_win": wins, "dealer_win": losses, "push": n - wins - losses}
+
+
+def dealer_outcome_probabilities(upcard_value: int, counts: Tuple[int, ...]) -> Tuple[float, ...]:
+    """Exact distribution of the dealer's final total, drawing from ``counts``.
+
+    ``upcard_value`` is the upcard's blackjack value with ace = 1, as Card.value.
+    ``counts`` is a remaining-deck composition as returned by Deck.composition()
+    (upcard already removed). Returns probabilities for 17, 18, 19, 20, 21 and
+    bust, in that order. Results are memoized per composition; see clear_cache().
+
+    Raises ValueError if ``upcard_value`` is outside 1-10, if ``counts`` is not
+    ten non-negative counts, or if some draw sequence exhausts ``counts`` before
+    the dealer reaches 17.
+    """
+    if not 1 <= upcard_value <= 10:
+        raise ValueError(f"upcard_value must be 1-10 (ace = 1), got {upcard_value}")
+    counts = tuple(counts)
+    if len(counts) != 10 or any(n < 0 for n in counts):
+        raise ValueError(f"counts must be 10 non-negative per-value counts, got {counts}")
+    return _dealer_outcomes(upcard_value, upcard_value == 1, counts)
+
+
+@lru_cache(maxsize=None)
+def _dealer_outcomes(hard: int, soft: bool, counts: Tuple[int, ...]) -> Tuple[float, ...]:
+    value = hard + 10 if soft and hard + 10 <= 21 else hard
+    remaining = sum(counts)
+    if value >= 17:
+        dist = [0.0] * 6
+        dist[min(value, 22) - 17] = 1.0
+        return tuple(dist)
+    if not remaining:
+        raise ValueError("composition runs out before the dealer reaches 17")
+    dist = [0.0] * 6
+    for i, n in enumerate(counts):
+        if not n:
+            continue
+        rest = counts[:i] + (n - 1,) + counts[i + 1 :]
+        sub = _dealer_outcomes(hard + i + 1, soft or i == 0, rest)
+        p = n / remaining
+        for k in range(6):
+            dist[k] += p * sub[k]
+    return tuple(dist)
+
+
+def clear_cache() -> None:
+    """Drop memoized dealer outcome distributions."""
+    _dealer_outcomes.cache_clear()
\ No newline at end of file
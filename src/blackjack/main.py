@@ -23,6 +23,7 @@ Notes:
 
 from __future__ import annotations
 import tkinter as tk
+from collections.abc import Sequence
 from tkinter import ttk, messagebox
 
 from .game import GameState, Card
@@ -30,6 +31,8 @@ from .assets import CardImageProvider
 from .utils import suit_symbol
 
 CARD_W, CARD_H = 100, 145
+# Most cards a hand can show: 21 from A A A A 2 2 2 2 3 3 3, plus the card that busts it
+MAX_HAND = 12
 
 
 class BlackjackApp(tk.Tk):
@@ -39,6 +42,13 @@ class BlackjackApp(tk.Tk):
         self.resizable(False, False)
         self.state = GameState()
         self.images = CardImageProvider(card_w=CARD_W, card_h=CARD_H)
+        # Pick the card renderer once instead of testing each image on every refresh
+        if self.images.has_real_images:
+            self._draw_card_impl = self._draw_card_image
+            self._draw_back_impl = self._draw_back_image
+        else:
+            self._draw_card_impl = self._draw_card_text
+            self._draw_back_impl = self._draw_back_text
 
         self._build_ui()
         self._new_game()
@@ -59,6 +69,9 @@ class BlackjackApp(tk.Tk):
         self.dealer_canvas.pack()
         self.player_canvas = tk.Canvas(self.player_frame, width=520, height=CARD_H + 16, bg="#0a0a0a")
         self.player_canvas.pack()
+        # Card image items are created once and reconfigured on every refresh
+        self._dealer_items = self._make_card_items(self.dealer_canvas)
+        self._player_items = self._make_card_items(self.player_canvas)
 
         # Info bar
         info = ttk.Frame(root)
@@ -82,6 +95,9 @@ class BlackjackApp(tk.Tk):
         # Style
         self._apply_theme()
 
+    def _make_card_items(self, canvas: tk.Canvas) -> list[int]:
+        return [canvas.create_image(0, 0, anchor=tk.NW, state=tk.HIDDEN) for _ in range(MAX_HAND)]
+
     def _apply_theme(self) -> None:
         style = ttk.Style(self)
         style.theme_use("clam")
@@ -120,43 +136,89 @@ class BlackjackApp(tk.Tk):
         # Update deck counter
         self.deck_var.set(f"Deck: {self.state.deck.remaining()}")
         # Draw cards
-        self._draw_hand(self.dealer_canvas, self.state.dealer_hand.cards, hide_first=self.state.in_round)
-        self._draw_hand(self.player_canvas, self.state.player_hand.cards, hide_first=False)
+        self._draw_hand(
+            self.dealer_canvas,
+            self._dealer_items,
+            self.state.dealer_hand.cards,
+            hide_first=self.state.in_round,
+        )
+        self._draw_hand(
+            self.player_canvas, self._player_items, self.state.player_hand.cards, hide_first=False
+        )
         # Enable/disable controls
         can_play = self.state.in_round
         self.btn_hit.configure(state=tk.NORMAL if can_play else tk.DISABLED)
         self.btn_stand.configure(state=tk.NORMAL if can_play else tk.DISABLED)
 
-    def _draw_hand(self, canvas: tk.Canvas, cards: list[Card], hide_first: bool) -> None:
-        canvas.delete("all")
+    def _draw_hand(
+        self, canvas: tk.Canvas, items: list[int], cards: Sequence[Card], hide_first: bool
+    ) -> None:
+        # Only drawn primitives (no-Pillow text fallback) are recreated
+        canvas.delete("drawn")
         x, y = 10, 8
-        for idx, card in enumerate(cards):
+        for idx, item in enumerate(items):
+            if idx >= len(cards):
+                canvas.itemconfigure(item, state=tk.HIDDEN)
+                continue
             if idx == 0 and hide_first:
-                self._draw_back(canvas, x, y)
+                self._draw_back_impl(canvas, item, x, y)
             else:
-                self._draw_card(canvas, x, y, card)
+                self._draw_card_impl(canvas, item, x, y, cards[idx])
             x += CARD_W + 12
         # Totals
         if not hide_first:
             total = sum(c.value for c in cards if c.rank != "A")
             # We show dynamic total via game state; optional overlay could be added
 
-    def _draw_card(self, canvas: tk.Canvas, x: int, y: int, card: Card) -> None:
-        img = self.images.get(card)
-        if img.width() > 1 and img.height() > 1:  # actual image loaded
-            canvas.create_image(x, y, image=img, anchor=tk.NW)
-        else:
-            # Text fallback (no Pillow): draw a simple card
-            r = 12
-            canvas.create_rectangle(x, y, x + CARD_W, y + CARD_H, outline="white", width=2, radius=r)
-            canvas.create_text(x + 14, y + 14, text=card.rank, anchor=tk.NW, fill="white", font=("Segoe UI", 12, "bold"))
-            canvas.create_text(x + CARD_W / 2, y + CARD_H / 2, text=suit_symbol(card.suit), fill="white", font=("Segoe UI", 20, "bold"))
-
-    def _draw_back(self, canvas: tk.Canvas, x: int, y: int) -> None:
-        r = 12
-        canvas.create_rectangle(x, y, x + CARD_W, y + CARD_H, outline="white", width=2, radius=r)
-        canvas.create_rectangle(x + 6, y + 6, x + CARD_W - 6, y + CARD_H - 6, outline="white")
-        canvas.create_text(x + CARD_W / 2, y + CARD_H / 2, text="★", fill="white", font=("Segoe UI", 24))
+    def _draw_card_image(self, canvas: tk.Canvas, item: int, x: int, y: int, card: Card) -> None:
+        canvas.itemconfigure(item, image=self.images.get(card), state=tk.NORMAL)
+        canvas.coords(item, x, y)
+
+    def _draw_card_text(self, canvas: tk.Canvas, item: int, x: int, y: int, card: Card) -> None:
+        # Text fallback (no Pillow): draw a simple card
+        canvas.itemconfigure(item, state=tk.HIDDEN)
+        canvas.create_rectangle(
+            x, y, x + CARD_W, y + CARD_H, outline="white", width=2, tags="drawn"
+        )
+        canvas.create_text(
+            x + 14,
+            y + 14,
+            text=card.rank,
+            anchor=tk.NW,
+            fill="white",
+            font=("Segoe UI", 12, "bold"),
+            tags="drawn",
+        )
+        canvas.create_text(
+            x + CARD_W / 2,
+            y + CARD_H / 2,
+            text=suit_symbol(card.suit),
+            fill="white",
+            font=("Segoe UI", 20, "bold"),
+            tags="drawn",
+        )
+
+    def _draw_back_image(self, canvas: tk.Canvas, item: int, x: int, y: int) -> None:
+        canvas.itemconfigure(item, image=self.images.back(), state=tk.NORMAL)
+        canvas.coords(item, x, y)
+
+    def _draw_back_text(self, canvas: tk.Canvas, item: int, x: int, y: int) -> None:
+        # Text fallback (no Pillow): draw a simple back
+        canvas.itemconfigure(item, state=tk.HIDDEN)
+        canvas.create_rectangle(
+            x, y, x + CARD_W, y + CARD_H, outline="white", width=2, tags="drawn"
+        )
+        canvas.create_rectangle(
+            x + 6, y + 6, x + CARD_W - 6, y + CARD_H - 6, outline="white", tags="drawn"
+        )
+        canvas.create_text(
+            x + CARD_W / 2,
+            y + CARD_H / 2,
+            text="★",
+            fill="white",
+            font=("Segoe UI", 24),
+            tags="drawn",
+        )
 
     def _update_status(self, msg: str) -> None:
         self.status_var.set(msg)
@@ -29,17 +29,11 @@ from typing import Iterable
 def best_ace_total(base: int, aces: int) -> int:
     """Return the best hand value given a base (non-ace sum) and ace count.
 
-    Aces can be 1 or 11; pick the highest <= 21.
+    Aces can be 1 or 11; pick the highest <= 21. At most one ace can ever
+    count as 11 (two would already make 22), so no search is needed.
     """
-    # Start with all aces as 1
     total = base + aces
-    # Upgrade some aces to 11 where possible (+10 each)
-    for _ in range(aces):
-        if total + 10 <= 21:
-            total += 10
-        else:
-            break
-    return total
+    return total + 10 if aces and total + 10 <= 21 else total
 
 
 @lru_cache(maxsize=None)
@@ -21,7 +21,22 @@ Notes:
 ===================================================================
 """
 
-from blackjack.game import Hand, Card, GameState
+import copy
+import multiprocessing
+import pickle
+
+import numpy as np
+import pytest
+
+from blackjack.game import (
+    Hand,
+    Card,
+    Deck,
+    GameState,
+    clear_cache,
+    dealer_outcome_probabilities,
+    simulate_rounds,
+)
 
 
 def test_ace_evaluation():
@@ -52,4 +67,114 @@ def test_compare_outcomes():
     g.dealer_hand.cards = [Card("10", "hearts"), Card("9", "clubs")]
     assert g._compare() == "push"
     g.dealer_hand.cards = [Card("10", "hearts"), Card("K", "clubs")]
-    assert g._compare() == "dealer"
\ No newline at end of file
+    assert g._compare() == "dealer"
+
+
+def test_deck_deals_each_card_once():
+    d = Deck()
+    drawn = [d.draw() for _ in range(52)]
+    assert len(set(drawn)) == 52
+    assert d.remaining() == 0
+    d.draw()  # exhausted deck starts over
+    assert d.remaining() == 51
+
+
+def test_simulate_rounds_counts():
+    res = simulate_rounds(20_000, rng=np.random.default_rng(5))
+    assert sum(res.values()) == 20_000
+    # Player busts first, so mimicking the dealer loses on balance
+    assert res["dealer_win"] > res["player_win"] > 0
+    with pytest.raises(ValueError):
+        simulate_rounds(10, player_stand=22)
+
+
+def test_dealer_outcome_probabilities():
+    clear_cache()
+    # Only sevens left: a ten upcard must finish on exactly 17
+    assert dealer_outcome_probabilities(10, (0, 0, 0, 0, 0, 0, 4, 0, 0, 0)) == (1.0, 0, 0, 0, 0, 0)
+    d = Deck()
+    counts = list(d.composition())
+    assert counts == [4, 4, 4, 4, 4, 4, 4, 4, 4, 16]
+    counts[5] -= 1  # dealer shows a 6
+    dist = dealer_outcome_probabilities(6, tuple(counts))
+    assert abs(sum(dist) - 1.0) < 1e-9
+    assert 0.4 < dist[-1] < 0.45  # bust
+
+
+def test_dealer_outcome_probabilities_rejects_bad_input():
+    with pytest.raises(ValueError):
+        dealer_outcome_probabilities(11, (4,) * 9 + (16,))  # ace must be passed as 1
+    with pytest.raises(ValueError):
+        dealer_outcome_probabilities(10, (0, 0, 0, 0, 1, 0, 0, 0, 0, 0))  # 10 + 5, then empty
+    with pytest.raises(ValueError):
+        dealer_outcome_probabilities(10, (0, 0, 0, 0, 0, -1, 5, 0, 0, 0))  # negative count
+    with pytest.raises(ValueError):
+        dealer_outcome_probabilities(10, (4,) * 13)  # per-rank, not per-value
+
+
+def test_stand_dealer_reaches_17():
+    for _ in range(200):
+        g = GameState()
+        g.new_round()
+        g.stand()
+        assert g.dealer_hand.value >= 17
+        assert g.outcome in {"player", "dealer", "push"}
+
+
+def test_cards_are_interned():
+    c = Card("10", "hearts")
+    assert c is Card("10", "hearts")
+    assert pickle.loads(pickle.dumps(c)) is c
+    assert copy.deepcopy(c) is c
+    assert (c.value, c.name) == (10, "10_hearts")
+    assert repr(c) == "Card(rank='10', suit='hearts')"
+
+
+def test_seeded_rng_is_reproducible():
+    a, b = Deck(rng=np.random.default_rng(7)), Deck(rng=np.random.default_rng(7))
+    assert [a.draw() for _ in range(52)] == [b.draw() for _ in range(52)]
+    g1 = GameState(deck=Deck(rng=np.random.default_rng(3)))
+    g2 = GameState(deck=Deck(rng=np.random.default_rng(3)))
+    g1.new_round()
+    g2.new_round()
+    assert g1.player_hand.cards == g2.player_hand.cards
+    assert simulate_rounds(500, rng=np.random.default_rng(1)) == simulate_rounds(
+        500, rng=np.random.default_rng(1)
+    )
+
+
+def test_compare_busts():
+    g = GameState()
+    g.player_hand.cards = [Card("10", "hearts"), Card("9", "spades"), Card("5", "clubs")]
+    g.dealer_hand.cards = [Card("K", "hearts"), Card("Q", "clubs"), Card("J", "spades")]
+    assert g._compare() == "dealer"  # player bust loses even if dealer busts too
+    g.player_hand.cards = [Card("2", "hearts"), Card("3", "spades")]
+    assert g._compare() == "player"
+
+
+def test_hand_from_indices():
+    ace, king = Card("A", "hearts"), Card("K", "hearts")
+    h = Hand.from_indices([ace.index, king.index])
+    assert h.cards == (ace, king)
+    assert Hand.from_indices(c.index for c in h.cards).cards == h.cards  # round-trips
+    assert h.is_blackjack()
+    h.add(Card("5", "clubs").index)
+    h.add(Card("9", "clubs"))
+    assert h.value == 25 and h.is_bust()
+    with pytest.raises(AttributeError):
+        h.cards.append(ace)  # read-only: mutate via add() instead
+
+
+def _fork_worker(_):
+    d = Deck()
+    return [d.draw().name for _ in range(3)], simulate_rounds(1000)
+
+
+def test_forked_workers_get_distinct_streams():
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method unavailable")
+    Deck()  # touch the shared generator in the parent first
+    with multiprocessing.get_context("fork").Pool(3) as pool:
+        results = pool.map(_fork_worker, range(3))
+    assert len({tuple(cards) for cards, _ in results}) > 1
+    assert len({tuple(res.items()) for _, res in results}) > 1
\ No newline at end of file